@@ -0,0 +1,723 @@
+#!/usr/bin/env python3
+"""
+Backend Daemon Example - Simplified Implementation
+Demonstrates a single shared backend serving many UI clients over a Unix socket
+
+Note: This is a simplified educational example created for demo purposes.
+It reuses the window detection and configuration examples from this directory.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import socket
+import stat
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+
+SOCKET_NAME = "multi-ai-chat-manager.sock"
+
+# Large enough for an update_config carrying a big ai_apps list
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+# Subscribers whose unsent notifications exceed this are disconnected
+MAX_SUBSCRIBER_BUFFER_BYTES = 1024 * 1024
+
+
+def default_socket_path() -> str:
+    """Per-user socket path, preferring the private XDG runtime directory"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, SOCKET_NAME)
+    return os.path.join(tempfile.gettempdir(), f"{os.getuid()}-{SOCKET_NAME}")
+
+
+def _load_example(filename: str, module_name: str):
+    """Load a sibling example script (the file names are not importable)"""
+    path = Path(__file__).with_name(filename)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+window_detection = _load_example("window-detection.py", "window_detection")
+config_management = _load_example("config-management.py", "config_management")
+
+
+class JsonRpcError(Exception):
+    """Error reported back to the client as a JSON-RPC error object"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class SharedBackendState:
+    """
+    State shared by every connected client.
+
+    One detection engine and one configuration are kept for the whole
+    daemon, so clients reuse each other's window scans instead of each
+    running their own.
+    """
+
+    def __init__(self, config: Dict, config_manager=None, cache_ttl: float = 2.0):
+        self.config = config
+        self.config_manager = config_manager
+        self.detection_engine = window_detection.WindowDetectionEngine(config)
+        self.window_manager = window_detection.WindowManager(config)
+        self.cache_ttl = cache_ttl
+        self.logger = logging.getLogger(__name__)
+
+        # Set when a RefreshScheduler owns rescanning (see create_scheduler)
+        self.scheduler: Optional['RefreshScheduler'] = None
+
+        self._cached_windows: List[Dict] = []
+        self._cached_window_info: List = []
+        self._cache_timestamp = 0.0
+        self._listeners: List[Callable[[str, Any], None]] = []
+
+    def add_listener(self, callback: Callable[[str, Any], None]):
+        """Register a callback for state change events"""
+        self._listeners.append(callback)
+
+    def get_active_apps(self, force_refresh: bool = False) -> List[Dict]:
+        """Return detected AI windows, rescanning only when the cache is stale"""
+        self._ensure_fresh(force_refresh)
+        return self._cached_windows
+
+    def _ensure_fresh(self, force_refresh: bool = False):
+        """
+        Rescan if needed. With a scheduler, its loop keeps the cache fresh
+        and any extra scan goes through run_once() to count against the
+        CPU budget; without one, a simple TTL applies.
+        """
+        if self.scheduler is not None:
+            # Not a user action: counted as a scan but not as a triggered one
+            if force_refresh or not self._cache_timestamp:
+                self.scheduler.run_once()
+            return
+
+        age = time.monotonic() - self._cache_timestamp
+        if force_refresh or not self._cache_timestamp or age > self.cache_ttl:
+            self.refresh_windows()
+
+    def refresh_windows(self) -> bool:
+        """Rescan windows and notify listeners if the result changed"""
+        window_info = self.detection_engine.detect_ai_windows()
+        windows = [asdict(w) for w in window_info]
+        changed = windows != self._cached_windows
+
+        self._cached_windows = windows
+        self._cached_window_info = window_info
+        self._cache_timestamp = time.monotonic()
+
+        if changed:
+            self._emit('windows_changed', {'windows': windows})
+        return changed
+
+    def start_ai_apps(self) -> Dict:
+        """
+        Simulate launching all enabled AI applications.
+        In a real implementation, this would start the browser processes.
+        """
+        enabled = [app['name'] for app in self.config.get('ai_apps', [])
+                   if app.get('enabled')]
+        for name in enabled:
+            self.logger.info(f"Starting {name}")
+        return {'started': len(enabled), 'apps': enabled}
+
+    def arrange_windows(self, params: Dict) -> Dict:
+        """Arrange the detected AI windows in a grid"""
+        grid = self.config.get('window', {}).get('grid', {})
+        cols = params.get('cols', grid.get('cols', 4))
+        rows = params.get('rows', grid.get('rows', 2))
+
+        self._ensure_fresh()
+        return self.window_manager.arrange_windows_grid(
+            self._cached_window_info, cols=cols, rows=rows
+        )
+
+    def update_config(self, config: Dict) -> Dict:
+        """Validate and apply a new configuration for all clients"""
+        if self.config_manager is not None:
+            success, errors = self.config_manager.save_configuration(config)
+        else:
+            success, errors = config_management.ConfigSchema().validate(config)
+
+        if not success:
+            return {
+                'success': False,
+                'errors': [asdict(error) for error in errors]
+            }
+
+        self.config = config
+        self._emit('config_changed', {'config': config})
+        return {'success': True, 'errors': []}
+
+    def _emit(self, event_type: str, data: Any):
+        """Notify all listeners of a state change"""
+        for listener in self._listeners:
+            try:
+                listener(event_type, data)
+            except Exception as e:
+                self.logger.error(f"Listener notification failed: {e}")
+
+
+class RefreshScheduler:
+    """
+    Adaptive detection refresh scheduler.
+
+    Rescans quickly while windows are changing and backs off exponentially
+    while the desktop is idle. Scans, including triggered ones, are skipped
+    while the CPU budget for the last minute is spent. User actions such as
+    starting apps or arranging windows call trigger() to rescan immediately.
+    """
+
+    MIN_INTERVAL_FLOOR = 0.1  # Seconds; anything lower is effectively a busy loop
+
+    DEFAULT_SETTINGS = {
+        'min_interval': 0.5,
+        'max_interval': 30.0,
+        'backoff_factor': 2.0,
+        'cpu_budget_per_minute': 1.0
+    }
+
+    def __init__(self, refresh: Callable[[], bool], settings: Optional[Dict] = None):
+        self.refresh = refresh
+        self.logger = logging.getLogger(__name__)
+        self.configure(settings)
+
+        self.scans = 0
+        self.triggered_scans = 0
+        self.skipped_scans = 0
+        self.recent_intervals: Deque[float] = deque(maxlen=20)
+        self._cpu_samples: Deque[Tuple[float, float]] = deque()
+        self._triggered = False
+        # Created in run() so it binds to the running loop (Python 3.8/3.9)
+        self._wake: Optional[asyncio.Event] = None
+
+    def configure(self, settings: Optional[Dict] = None):
+        """
+        Apply detection.refresh settings, e.g. after a config update.
+        Raises ValueError and keeps the current settings if any value is invalid.
+        """
+        values = self._parse_settings(settings or {})
+
+        self.min_interval = values['min_interval']
+        self.max_interval = values['max_interval']
+        self.backoff_factor = values['backoff_factor']
+        self.cpu_budget = values['cpu_budget_per_minute']
+        self.interval = self.min_interval
+
+    def _parse_settings(self, settings: Dict) -> Dict[str, float]:
+        """Coerce settings to floats and reject values that would busy-loop or never back off"""
+        if not isinstance(settings, dict):
+            raise ValueError("detection.refresh must be an object")
+
+        values = {}
+        for name, default in self.DEFAULT_SETTINGS.items():
+            try:
+                values[name] = float(settings.get(name, default))
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"detection.refresh.{name} must be a number, "
+                    f"got {settings.get(name)!r}"
+                )
+
+        if values['min_interval'] < self.MIN_INTERVAL_FLOOR:
+            raise ValueError(
+                f"detection.refresh.min_interval must be at least "
+                f"{self.MIN_INTERVAL_FLOOR}s, got {values['min_interval']}"
+            )
+        if values['max_interval'] < values['min_interval']:
+            raise ValueError(
+                "detection.refresh.max_interval must not be below min_interval"
+            )
+        if values['backoff_factor'] < 1:
+            raise ValueError(
+                f"detection.refresh.backoff_factor must be at least 1, "
+                f"got {values['backoff_factor']}"
+            )
+        if values['cpu_budget_per_minute'] <= 0:
+            raise ValueError(
+                "detection.refresh.cpu_budget_per_minute must be positive"
+            )
+        return values
+
+    def trigger(self):
+        """Request an immediate rescan after a user action"""
+        self._triggered = True
+        if self._wake is not None:
+            self._wake.set()
+
+    async def run(self):
+        """Scan loop; runs until cancelled"""
+        self._wake = asyncio.Event()
+        while True:
+            if not self._triggered:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            triggered = self._triggered
+            self._triggered = False
+            self._wake.clear()
+            self.run_once(triggered)
+
+    def run_once(self, triggered: bool = False) -> bool:
+        """Run one scan if the CPU budget allows; returns True if it ran"""
+        if self.cpu_used() >= self.cpu_budget:
+            self.skipped_scans += 1
+            self.interval = self._time_until_budget_frees()
+            self.recent_intervals.append(self.interval)
+            self.logger.debug("Skipping rescan: CPU budget exhausted")
+            return False
+
+        start = time.thread_time()
+        try:
+            changed = self.refresh()
+        except Exception as e:
+            self.logger.error(f"Scheduled rescan failed: {e}")
+            changed = False
+        self._cpu_samples.append((time.monotonic(), time.thread_time() - start))
+
+        self.scans += 1
+        if triggered:
+            self.triggered_scans += 1
+
+        # Changes (or user actions) keep scanning fast; idle periods back off
+        if changed or triggered:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff_factor,
+                                self.max_interval)
+        self.recent_intervals.append(self.interval)
+        return True
+
+    def cpu_used(self) -> float:
+        """CPU seconds spent scanning during the last minute"""
+        cutoff = time.monotonic() - 60.0
+        while self._cpu_samples and self._cpu_samples[0][0] < cutoff:
+            self._cpu_samples.popleft()
+        return sum(cost for _, cost in self._cpu_samples)
+
+    def _time_until_budget_frees(self) -> float:
+        """Delay until the oldest CPU sample leaves the one-minute window"""
+        if not self._cpu_samples:
+            return self.max_interval
+        remaining = self._cpu_samples[0][0] + 60.0 - time.monotonic()
+        return min(self.max_interval, max(self.min_interval, remaining))
+
+    def get_stats(self) -> Dict:
+        """Scheduler state for monitoring"""
+        return {
+            'interval': self.interval,
+            'recent_intervals': list(self.recent_intervals),
+            'scans': self.scans,
+            'triggered_scans': self.triggered_scans,
+            'skipped_scans': self.skipped_scans,
+            'cpu_used_last_minute': self.cpu_used(),
+            'cpu_budget_per_minute': self.cpu_budget
+        }
+
+
+class BackendDaemon:
+    """
+    Simplified JSON-RPC daemon listening on a Unix domain socket.
+
+    Uses the same newline-delimited JSON-RPC messages as the stdin/stdout
+    bridge. Clients may connect, disconnect and reconnect freely; the
+    daemon and its shared state keep running until it is stopped.
+    """
+
+    def __init__(self, state: SharedBackendState,
+                 socket_path: Optional[str] = None,
+                 scheduler: Optional[RefreshScheduler] = None):
+        self.state = state
+        self.socket_path = socket_path or default_socket_path()
+        self.scheduler = scheduler
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self.clients: Set[asyncio.StreamWriter] = set()
+        self.subscribers: Set[asyncio.StreamWriter] = set()
+        self._client_tasks: Set[asyncio.Task] = set()
+        self.logger = logging.getLogger(__name__)
+
+        self.methods = {
+            'get_active_apps': self._get_active_apps,
+            'start_ai_apps': self._start_ai_apps,
+            'arrange_windows': self._arrange_windows,
+            'get_config': self._get_config,
+            'update_config': self._update_config,
+            'subscribe': self._subscribe,
+            'unsubscribe': self._unsubscribe,
+            'get_status': self._get_status,
+            'get_scheduler_stats': self._get_scheduler_stats,
+        }
+
+        self.state.add_listener(self._broadcast)
+
+    async def start(self):
+        """Bind the Unix socket and start accepting clients"""
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError("Unix domain sockets are not available on this platform")
+
+        self._remove_stale_socket()
+
+        # Create the socket as 0o600 so it is never reachable by other users
+        old_umask = os.umask(0o177)
+        try:
+            self.server = await asyncio.start_unix_server(
+                self._handle_client, path=self.socket_path,
+                limit=MAX_REQUEST_BYTES
+            )
+        finally:
+            os.umask(old_umask)
+
+        if self.scheduler is not None:
+            self._scheduler_task = asyncio.create_task(self.scheduler.run())
+        self.logger.info(f"Backend daemon listening on {self.socket_path}")
+
+    def _remove_stale_socket(self):
+        """
+        Remove a socket left behind by a daemon that exited.
+        Refuses to touch a socket another daemon is still listening on.
+        """
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f"{self.socket_path} exists and is not a socket")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+
+        raise RuntimeError(
+            f"Another backend daemon is already listening on {self.socket_path}"
+        )
+
+    async def serve_forever(self):
+        """Run until cancelled"""
+        await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """Stop the scheduler, close all client connections and remove the socket"""
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            result, = await asyncio.gather(self._scheduler_task,
+                                           return_exceptions=True)
+            if isinstance(result, Exception):
+                self.logger.error(f"Refresh scheduler failed: {result}")
+            self._scheduler_task = None
+
+        for task in list(self._client_tasks):
+            task.cancel()
+        await asyncio.gather(*self._client_tasks, return_exceptions=True)
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        """Serve one client connection until it disconnects"""
+        task = asyncio.current_task()
+        self._client_tasks.add(task)
+        self.clients.add(writer)
+        self.logger.info(f"Client connected ({len(self.clients)} active)")
+        self._send(writer, {'status': 'ready'})
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Raised for LimitOverrunError; the oversized line is discarded
+                    self._send(writer, self._error_response(
+                        None, -32600,
+                        f"Invalid Request: line exceeds {MAX_REQUEST_BYTES} bytes"
+                    ))
+                    await writer.drain()
+                    continue
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                response = self._dispatch(line, writer)
+                if response is not None:
+                    self._send(writer, response)
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass  # Daemon is shutting down
+        finally:
+            self._client_tasks.discard(task)
+            self.clients.discard(writer)
+            self.subscribers.discard(writer)
+            writer.close()
+            self.logger.info(f"Client disconnected ({len(self.clients)} active)")
+
+    def _dispatch(self, line: bytes, writer: asyncio.StreamWriter) -> Optional[Dict]:
+        """Parse a request line and run the matching method"""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return self._error_response(None, -32700, f"Parse error: {e}")
+
+        if not isinstance(request, dict):
+            return self._error_response(
+                None, -32600, "Invalid Request: expected a JSON object"
+            )
+
+        request_id = request.get('id')
+        method = self.methods.get(request.get('method'))
+        if method is None:
+            return self._error_response(
+                request_id, -32601, f"Method not found: {request.get('method')}"
+            )
+
+        params = request.get('params') or {}
+        if not isinstance(params, dict):
+            return self._error_response(
+                request_id, -32602, "Invalid params: expected a JSON object"
+            )
+
+        try:
+            result = method(params, writer)
+        except JsonRpcError as e:
+            return self._error_response(request_id, e.code, e.message)
+        except Exception as e:
+            self.logger.error(f"Request {request.get('method')} failed: {e}")
+            return self._error_response(request_id, -32603, str(e))
+
+        # Requests without an id are notifications and get no response
+        if request_id is None:
+            return None
+
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    def _error_response(self, request_id: Any, code: int, message: str) -> Dict:
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'error': {'code': code, 'message': message}
+        }
+
+    def _send(self, writer: asyncio.StreamWriter, message: Dict):
+        """Write one newline-delimited JSON message"""
+        if writer.is_closing():
+            return
+        writer.write((json.dumps(message) + '\n').encode('utf-8'))
+
+    def _broadcast(self, event_type: str, data: Any):
+        """Fan out a state change notification to every subscriber"""
+        notification = {'jsonrpc': '2.0', 'method': event_type, 'params': data}
+        for writer in list(self.subscribers):
+            # Notifications are not drained; drop subscribers that stop reading
+            if writer.transport.get_write_buffer_size() > MAX_SUBSCRIBER_BUFFER_BYTES:
+                self.logger.warning("Disconnecting subscriber that is not reading")
+                self.subscribers.discard(writer)
+                writer.close()
+                continue
+            self._send(writer, notification)
+
+    # JSON-RPC methods
+
+    def _get_active_apps(self, params: Dict, writer) -> List[Dict]:
+        return self.state.get_active_apps(params.get('force_refresh', False))
+
+    def _start_ai_apps(self, params: Dict, writer) -> Dict:
+        result = self.state.start_ai_apps()
+        self._trigger_rescan()
+        return result
+
+    def _arrange_windows(self, params: Dict, writer) -> Dict:
+        result = self.state.arrange_windows(params)
+        self._trigger_rescan()
+        return result
+
+    def _get_config(self, params: Dict, writer) -> Dict:
+        return self.state.config
+
+    def _update_config(self, params: Dict, writer) -> Dict:
+        if 'config' not in params:
+            raise JsonRpcError(-32602, "Missing 'config' parameter")
+        return self.state.update_config(params['config'])
+
+    def _subscribe(self, params: Dict, writer) -> bool:
+        self.subscribers.add(writer)
+        return True
+
+    def _unsubscribe(self, params: Dict, writer) -> bool:
+        self.subscribers.discard(writer)
+        return True
+
+    def _get_scheduler_stats(self, params: Dict, writer) -> Optional[Dict]:
+        if self.scheduler is None:
+            return None
+        return self.scheduler.get_stats()
+
+    def _trigger_rescan(self):
+        if self.scheduler is not None:
+            self.scheduler.trigger()
+
+    def _get_status(self, params: Dict, writer) -> Dict:
+        return {
+            'clients': len(self.clients),
+            'subscribers': len(self.subscribers),
+            'socket_path': self.socket_path
+        }
+
+
+def create_shared_state(config_dir: Optional[str]) -> SharedBackendState:
+    """Load configuration once for the whole daemon"""
+    if config_dir is None:
+        config_dir = config_management.create_demo_config()
+
+    config_manager = config_management.ConfigManager(config_dir)
+    is_valid, config, errors = config_manager.load_configuration()
+    if not is_valid:
+        for error in errors:
+            logging.error(f"{error.field} - {error.message}")
+        raise SystemExit("Configuration is invalid")
+
+    return SharedBackendState(config, config_manager)
+
+
+def create_scheduler(state: SharedBackendState) -> RefreshScheduler:
+    """Build the refresh scheduler from the optional detection.refresh settings"""
+    settings = state.config.get('detection', {}).get('refresh', {})
+    scheduler = RefreshScheduler(state.refresh_windows, settings)
+    state.scheduler = scheduler
+
+    def apply_config_change(event_type: str, data: Any):
+        if event_type != 'config_changed':
+            return
+        refresh_settings = data['config'].get('detection', {}).get('refresh', {})
+        try:
+            scheduler.configure(refresh_settings)
+        except ValueError as e:
+            logging.getLogger(__name__).error(f"Keeping refresh settings: {e}")
+
+    state.add_listener(apply_config_change)
+    return scheduler
+
+
+async def demo_usage(socket_path: Optional[str]):
+    """Start the daemon and connect two clients to it"""
+    state = create_shared_state(None)
+    daemon = BackendDaemon(state, socket_path, create_scheduler(state))
+    await daemon.start()
+    socket_path = daemon.socket_path
+
+    async def open_client():
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        await reader.readline()  # Ready signal
+        return reader, writer
+
+    async def call(reader, writer, request_id, method, params=None):
+        request = {'jsonrpc': '2.0', 'id': request_id,
+                   'method': method, 'params': params or {}}
+        writer.write((json.dumps(request) + '\n').encode('utf-8'))
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    print("Connecting two clients to the shared daemon...")
+    reader_a, writer_a = await open_client()
+    reader_b, writer_b = await open_client()
+
+    await call(reader_b, writer_b, 1, 'subscribe')
+
+    response = await call(reader_a, writer_a, 1, 'get_active_apps')
+    print(f"Client A found {len(response['result'])} AI windows")
+
+    # Client B receives the notification caused by client A's scan
+    notification = json.loads(await reader_b.readline())
+    print(f"Client B notified: {notification['method']}")
+
+    # A second request is served from the shared cache without rescanning
+    response = await call(reader_b, writer_b, 2, 'get_active_apps')
+    print(f"Client B reused cached result ({len(response['result'])} windows)")
+
+    response = await call(reader_a, writer_a, 2, 'get_status')
+    print(f"Daemon status: {response['result']}")
+
+    # Arranging windows wakes the scheduler for an immediate rescan
+    await call(reader_a, writer_a, 3, 'arrange_windows')
+    await asyncio.sleep(0.1)
+    response = await call(reader_a, writer_a, 4, 'get_scheduler_stats')
+    print(f"Scheduler stats: {response['result']}")
+
+    writer_a.close()
+    writer_b.close()
+    await daemon.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared backend daemon")
+    parser.add_argument('--socket', default=None,
+                        help="Unix socket path to listen on "
+                             "(default: $XDG_RUNTIME_DIR/" + SOCKET_NAME + ")")
+    parser.add_argument('--config-dir', default=None,
+                        help="Directory containing settings.json and ai_apps.json")
+    parser.add_argument('--no-scheduler', action='store_true',
+                        help="Disable the adaptive detection refresh scheduler")
+    parser.add_argument('--demo', action='store_true',
+                        help="Run a short two-client demonstration and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    if args.demo:
+        asyncio.run(demo_usage(args.socket))
+        return
+
+    state = create_shared_state(args.config_dir)
+    try:
+        scheduler = None if args.no_scheduler else create_scheduler(state)
+    except ValueError as e:
+        raise SystemExit(f"Invalid refresh settings: {e}")
+    daemon = BackendDaemon(state, args.socket, scheduler)
+    try:
+        asyncio.run(daemon.serve_forever())
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
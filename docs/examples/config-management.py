@@ -6,13 +6,44 @@ Demonstrates configuration loading, validation, and hot-reloading concepts
 Note: This is a simplified educational example created for demo purposes.
 """
 
+import hashlib
 import json
+import marshal
 import os
+import sys
+import tempfile
 import time
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson  # Optional fast JSON parser
+except ImportError:
+    orjson = None
+
+
+# Bump whenever ConfigSchema rules change so stale cached configs are rejected
+CONFIG_CACHE_VERSION = 2
+CONFIG_CACHE_FILENAME = ".config_cache"
+
+# marshal output is only guaranteed to load on the same format and Python version
+CONFIG_CACHE_FORMAT = (CONFIG_CACHE_VERSION, marshal.version, tuple(sys.version_info[:2]))
+
+
+def parse_json(data: bytes, fast: bool = True) -> Any:
+    """
+    Parse JSON bytes with orjson when available, stdlib json otherwise.
+    orjson is stricter (NaN, huge integers, BOM), so anything it rejects is
+    retried with stdlib json to keep both paths accepting the same files.
+    """
+    if fast and orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 @dataclass
 class ValidationError:
@@ -95,6 +126,11 @@ class ConfigSchema:
             ai_errors = self._validate_ai_apps(config['ai_apps'])
             errors.extend(ai_errors)
 
+        # Detection refresh scheduler validation
+        refresh = self._get_nested_value(config, 'detection.refresh')
+        if refresh is not None:
+            errors.extend(self._validate_refresh(refresh))
+
         is_valid = not any(error.severity == 'error' for error in errors)
         return is_valid, errors
 
@@ -111,6 +147,58 @@ class ConfigSchema:
 
         return value
 
+    def _validate_refresh(self, refresh: Dict) -> List[ValidationError]:
+        """Validate detection refresh scheduler settings"""
+        errors = []
+
+        if not isinstance(refresh, dict):
+            errors.append(ValidationError(
+                field="detection.refresh",
+                message="Refresh settings must be an object",
+                severity='error'
+            ))
+            return errors
+
+        minimums = {
+            'min_interval': 0.1,
+            'max_interval': 0.1,
+            'backoff_factor': 1
+        }
+        for field in ['min_interval', 'max_interval', 'backoff_factor',
+                      'cpu_budget_per_minute']:
+            if field not in refresh:
+                continue
+            value = refresh[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append(ValidationError(
+                    field=f"detection.refresh.{field}",
+                    message=f"Expected number, got {type(value).__name__}",
+                    severity='error'
+                ))
+            elif field in minimums and value < minimums[field]:
+                errors.append(ValidationError(
+                    field=f"detection.refresh.{field}",
+                    message=f"Must be at least {minimums[field]}",
+                    severity='error'
+                ))
+            elif field == 'cpu_budget_per_minute' and value <= 0:
+                errors.append(ValidationError(
+                    field=f"detection.refresh.{field}",
+                    message="Must be positive",
+                    severity='error'
+                ))
+
+        min_interval = refresh.get('min_interval', 0.5)
+        max_interval = refresh.get('max_interval', 30.0)
+        if not errors and max_interval < min_interval:
+            errors.append(ValidationError(
+                field="detection.refresh.max_interval",
+                message="Must not be below min_interval",
+                severity='error'
+            ))
+
+        return errors
+
     def _validate_ai_apps(self, ai_apps: List[Dict]) -> List[ValidationError]:
         """Validate AI applications configuration"""
         errors = []
@@ -151,12 +239,17 @@ class ConfigManager:
     Demonstrates loading, validation, and hot-reloading concepts.
     """
 
-    def __init__(self, config_dir: str):
+    def __init__(self, config_dir: str, use_cache: bool = True,
+                 fast_json: bool = True):
         self.config_dir = Path(config_dir)
         self.schema = ConfigSchema()
         self.config = {}
         self.file_timestamps = {}
         self.observers = []
+        self.use_cache = use_cache
+        self.fast_json = fast_json
+        self.cache_path = self.config_dir / CONFIG_CACHE_FILENAME
+        self.last_load_cached = False
 
     def load_configuration(self) -> Tuple[bool, Optional[Dict], List[ValidationError]]:
         """Load and validate configuration from files"""
@@ -172,31 +265,63 @@ class ConfigManager:
             ))
             return False, None, errors
 
+        # Load AI apps configuration
+        ai_apps_path = self.config_dir / "ai_apps.json"
+        if not ai_apps_path.exists():
+            errors.append(ValidationError(
+                field="ai_apps",
+                message=f"AI apps file not found: {ai_apps_path}",
+                severity='error'
+            ))
+            return False, None, errors
+
         try:
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            settings_data = settings_path.read_bytes()
         except Exception as e:
             errors.append(ValidationError(
                 field="settings",
-                message=f"Failed to parse settings file: {e}",
+                message=f"Failed to read settings file: {e}",
                 severity='error'
             ))
             return False, None, errors
 
-        # Load AI apps configuration
-        ai_apps_path = self.config_dir / "ai_apps.json"
-        if not ai_apps_path.exists():
+        try:
+            ai_apps_data = ai_apps_path.read_bytes()
+        except Exception as e:
             errors.append(ValidationError(
                 field="ai_apps",
-                message=f"AI apps file not found: {ai_apps_path}",
+                message=f"Failed to read AI apps file: {e}",
+                severity='error'
+            ))
+            return False, None, errors
+
+        # Unchanged files: reuse the previously validated config
+        cache_key = None
+        cached = None
+        if self.use_cache:
+            cache_key = self._cache_key(settings_data, ai_apps_data)
+            cached = self._read_cache(cache_key)
+        self.last_load_cached = cached is not None
+        if cached is not None:
+            cached_config, warnings = cached
+            self.config = cached_config
+            self._update_file_timestamps()
+            self._notify_observers('config_loaded', self.config)
+            return True, cached_config, warnings
+
+        try:
+            settings = parse_json(settings_data, self.fast_json)
+        except Exception as e:
+            errors.append(ValidationError(
+                field="settings",
+                message=f"Failed to parse settings file: {e}",
                 severity='error'
             ))
             return False, None, errors
 
         try:
-            with open(ai_apps_path, 'r', encoding='utf-8') as f:
-                ai_apps_config = json.load(f)
-                settings['ai_apps'] = ai_apps_config.get('ai_apps', [])
+            ai_apps_config = parse_json(ai_apps_data, self.fast_json)
+            settings['ai_apps'] = ai_apps_config.get('ai_apps', [])
         except Exception as e:
             errors.append(ValidationError(
                 field="ai_apps",
@@ -211,11 +336,54 @@ class ConfigManager:
 
         if is_valid:
             self.config = settings
+            self._write_cache(cache_key, settings, errors)
             self._update_file_timestamps()
             self._notify_observers('config_loaded', self.config)
 
         return is_valid, settings, errors
 
+    def _cache_key(self, settings_data: bytes, ai_apps_data: bytes) -> str:
+        """Build a cache key from the content hashes of both config files"""
+        settings_hash = hashlib.sha256(settings_data).hexdigest()
+        ai_apps_hash = hashlib.sha256(ai_apps_data).hexdigest()
+        return f"{settings_hash}:{ai_apps_hash}"
+
+    def _read_cache(self, cache_key: str) -> Optional[Tuple[Dict, List[ValidationError]]]:
+        """
+        Return the cached validated config and its warnings if it matches the key.
+        Any unreadable or stale cache is treated as a miss. The cache is trusted
+        like the config files next to it, so it must live in a user-owned directory.
+        """
+        if not self.use_cache or not self.cache_path.exists():
+            return None
+
+        try:
+            cache_format, key, config, warnings = marshal.loads(
+                self.cache_path.read_bytes()
+            )
+            if cache_format != CONFIG_CACHE_FORMAT or key != cache_key:
+                return None
+            return config, [ValidationError(*warning) for warning in warnings]
+        except Exception:
+            return None
+
+    def _write_cache(self, cache_key: str, config: Dict,
+                     warnings: List[ValidationError]):
+        """Persist a validated config; failures only cost the next startup"""
+        if not self.use_cache:
+            return
+
+        warning_data = [(w.field, w.message, w.severity) for w in warnings]
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                marshal.dump((CONFIG_CACHE_FORMAT, cache_key, config, warning_data), f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            # e.g. a read-only config directory; report once, then stop trying
+            print(f"Failed to write config cache, disabling it: {e}")
+            self.use_cache = False
+
     def save_configuration(self, config: Dict) -> Tuple[bool, List[ValidationError]]:
         """Save configuration with validation"""
         # Validate before saving
@@ -305,9 +473,9 @@ class ConfigManager:
                 print(f"Observer notification failed: {e}")
 
 
-def create_demo_config():
+def create_demo_config(config_dir: str = "demo_config"):
     """Create demo configuration files for testing"""
-    config_dir = Path("demo_config")
+    config_dir = Path(config_dir)
     config_dir.mkdir(exist_ok=True)
 
     # Demo settings
@@ -428,5 +596,63 @@ def demo_usage():
     print(f"Changes detected: {changes}")
 
 
+def benchmark_startup(app_count: int = 20000, iterations: int = 5):
+    """Compare parser and cache startup costs with a large ai_apps file"""
+    print("Configuration Startup Benchmark")
+    print("=" * 40)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_dir = Path(create_demo_config(os.path.join(tmp_dir, "config")))
+        ai_apps = {
+            "ai_apps": [
+                {
+                    "name": f"AI Service {i}",
+                    "enabled": i % 2 == 0,
+                    "priority": i + 1,
+                    "keywords": [f"ai-service-{i}.com", f"chat assistant {i}"]
+                }
+                for i in range(app_count)
+            ]
+        }
+        with open(config_dir / "ai_apps.json", 'w') as f:
+            json.dump(ai_apps, f, indent=2)
+        size_kb = (config_dir / "ai_apps.json").stat().st_size / 1024
+        print(f"AI apps: {app_count} entries ({size_kb:.0f} KB)")
+
+        def time_load(use_cache: bool, fast_json: bool = True,
+                      clear_cache: bool = False) -> float:
+            best = float('inf')
+            for _ in range(iterations):
+                manager = ConfigManager(str(config_dir), use_cache=use_cache,
+                                        fast_json=fast_json)
+                if clear_cache and manager.cache_path.exists():
+                    manager.cache_path.unlink()
+                start = time.perf_counter()
+                is_valid, _, _ = manager.load_configuration()
+                best = min(best, time.perf_counter() - start)
+                assert is_valid
+                # Only a warm cached run may be served from the cache
+                assert manager.last_load_cached == (use_cache and not clear_cache)
+            return best * 1000
+
+        stdlib = time_load(use_cache=False, fast_json=False)
+        fast = time_load(use_cache=False) if orjson is not None else None
+        cold = time_load(use_cache=True, clear_cache=True)
+        warm = time_load(use_cache=True)
+
+    print(f"  stdlib json, no cache:  {stdlib:8.2f} ms")
+    if fast is not None:
+        print(f"  orjson, no cache:       {fast:8.2f} ms"
+              f"  ({stdlib / fast:.1f}x vs stdlib)")
+    else:
+        print("  orjson, no cache:       not installed")
+    print(f"  Cache miss (write):     {cold:8.2f} ms")
+    print(f"  Cache hit:              {warm:8.2f} ms"
+          f"  ({stdlib / warm:.1f}x vs stdlib)")
+
+
 if __name__ == "__main__":
-    demo_usage()
\ No newline at end of file
+    if "--benchmark" in sys.argv:
+        benchmark_startup()
+    else:
+        demo_usage()
\ No newline at end of file
@@ -7,6 +7,7 @@
 
 const { spawn } = require('child_process');
 const { EventEmitter } = require('events');
+const net = require('net');
 
 /**
  * JSON-RPC Bridge for Electron-Python communication
@@ -17,24 +18,38 @@ class ElectronPythonBridge extends EventEmitter {
         super();
 
         this.pythonProcess = null;
+        this.socket = null;
         this.scriptPath = pythonScriptPath;
         this.requestId = 0;
         this.pendingRequests = new Map();
+        this.outputBuffer = '';
         this.connected = false;
+        this.closing = false;
+        this.retryCount = 0;
+        this.subscribed = false;
 
         // Configuration options
         this.options = {
             timeout: options.timeout || 30000,
             pythonExecutable: options.pythonExecutable || 'python',
             maxRetries: options.maxRetries || 3,
+            socketPath: options.socketPath || null,  // Shared daemon mode
+            retryDelay: options.retryDelay || 1000,
             ...options
         };
     }
 
     /**
-     * Start the Python subprocess and establish communication
+     * Establish communication with the Python backend.
+     * Spawns a private subprocess, or attaches to a shared daemon
+     * when a socketPath is configured.
      */
     async connect() {
+        this.closing = false;
+        if (this.options.socketPath) {
+            return this._connectSocket();
+        }
+
         return new Promise((resolve, reject) => {
             try {
                 // Spawn Python process
@@ -85,6 +100,148 @@ class ElectronPythonBridge extends EventEmitter {
         });
     }
 
+    /**
+     * Connect to a shared backend daemon over a Unix domain socket
+     */
+    _connectSocket() {
+        return new Promise((resolve, reject) => {
+            const socket = net.createConnection(this.options.socketPath);
+            socket.setEncoding('utf8');  // Keep multi-byte characters split across chunks intact
+            this.socket = socket;
+            this.outputBuffer = '';
+
+            const onReady = () => {
+                clearTimeout(timer);
+                this.connected = true;
+                this.retryCount = 0;
+                resolve();
+            };
+
+            const fail = (error) => {
+                clearTimeout(timer);
+                this.removeListener('ready', onReady);
+                reject(error);
+            };
+
+            const timer = setTimeout(() => {
+                fail(new Error('Backend daemon connection timeout'));
+                socket.destroy();
+            }, this.options.timeout);
+
+            // Events from a socket replaced by a later connect() are ignored
+            socket.on('data', (data) => {
+                if (this.socket !== socket) {
+                    return;
+                }
+                this._handlePythonOutput(data);
+            });
+
+            socket.on('error', (error) => {
+                if (this.socket !== socket) {
+                    return;
+                }
+                if (!this.connected) {
+                    fail(error);
+                    return;
+                }
+                console.error('Backend daemon socket error:', error);
+                this.emit('error', error);
+            });
+
+            socket.on('close', () => {
+                if (this.socket !== socket) {
+                    return;
+                }
+                const wasConnected = this.connected;
+                this.connected = false;
+                this.socket = null;
+                this._rejectPendingRequests(new Error('Backend daemon disconnected'));
+
+                if (wasConnected) {
+                    this.emit('disconnected', null);
+                    if (!this.closing) {
+                        this._scheduleReconnect();
+                    }
+                }
+            });
+
+            this.once('ready', onReady);
+        });
+    }
+
+    /**
+     * Reconnect to the daemon after an unexpected disconnect.
+     * The daemon keeps running, so only this client's connection is retried.
+     */
+    _scheduleReconnect() {
+        if (this.retryCount >= this.options.maxRetries) {
+            this.emit('error', new Error('Backend daemon reconnect failed'));
+            return;
+        }
+
+        this.retryCount++;
+        setTimeout(async () => {
+            if (this.closing) {
+                return;
+            }
+            try {
+                await this._connectSocket();
+                // Subscriptions belong to the old connection on the daemon side
+                if (this.subscribed) {
+                    await this.sendRequest('subscribe');
+                }
+                this.emit('reconnected');
+            } catch (error) {
+                console.warn('Reconnect attempt failed:', error.message);
+                this._dropSocket();
+                this._scheduleReconnect();
+            }
+        }, this.options.retryDelay * this.retryCount);
+    }
+
+    /**
+     * Close a connection that failed after connecting (e.g. re-subscribing)
+     * so it does not linger as a ghost client on the daemon
+     */
+    _dropSocket() {
+        const socket = this.socket;
+        if (!socket) {
+            return;
+        }
+        // Detach first so the close handler ignores this socket
+        this.socket = null;
+        this.connected = false;
+        socket.destroy();
+    }
+
+    /**
+     * Subscribe to change notifications from a shared backend daemon.
+     * The subscription is renewed automatically after a reconnect.
+     */
+    async subscribe() {
+        const result = await this.sendRequest('subscribe');
+        this.subscribed = true;
+        return result;
+    }
+
+    /**
+     * Stop receiving change notifications
+     */
+    async unsubscribe() {
+        this.subscribed = false;
+        return this.sendRequest('unsubscribe');
+    }
+
+    /**
+     * Reject all outstanding requests, e.g. when the connection drops
+     */
+    _rejectPendingRequests(error) {
+        for (const pendingRequest of this.pendingRequests.values()) {
+            pendingRequest.reject(error);
+        }
+        this.pendingRequests.clear();
+    }
+
     /**
      * Send a JSON-RPC request to Python backend
      */
@@ -111,7 +268,11 @@ class ElectronPythonBridge extends EventEmitter {
 
             // Send request
             const requestData = JSON.stringify(request) + '\n';
-            this.pythonProcess.stdin.write(requestData);
+            if (this.socket) {
+                this.socket.write(requestData);
+            } else {
+                this.pythonProcess.stdin.write(requestData);
+            }
 
             // Setup timeout
             setTimeout(() => {
@@ -127,7 +288,11 @@ class ElectronPythonBridge extends EventEmitter {
      * Handle output from Python process
      */
     _handlePythonOutput(data) {
-        const lines = data.toString().split('\n').filter(line => line.trim());
+        // Socket reads may split a message across chunks; keep the remainder
+        const text = this.outputBuffer + data.toString();
+        const parts = text.split('\n');
+        this.outputBuffer = parts.pop();
+        const lines = parts.filter(line => line.trim());
 
         for (const line of lines) {
             try {
@@ -174,12 +339,20 @@ class ElectronPythonBridge extends EventEmitter {
      * Disconnect from Python backend
      */
     disconnect() {
+        this.closing = true;
+        this.subscribed = false;
+        if (this.socket) {
+            // Only close this client; the shared daemon keeps running
+            this.socket.end();
+            this.socket = null;
+        }
         if (this.pythonProcess) {
             this.pythonProcess.kill();
             this.pythonProcess = null;
         }
         this.connected = false;
-        this.pendingRequests.clear();
+        this.outputBuffer = '';
+        this._rejectPendingRequests(new Error('Bridge disconnected'));
     }
 
     /**
@@ -194,8 +367,8 @@ class ElectronPythonBridge extends EventEmitter {
  * High-level API wrapper for common operations
  */
 class AIWindowManager {
-    constructor(bridgePath) {
-        this.bridge = new ElectronPythonBridge(bridgePath);
+    constructor(bridgePath, bridgeOptions = {}) {
+        this.bridge = new ElectronPythonBridge(bridgePath, bridgeOptions);
         this.activeApps = [];
         this.setupEventHandlers();
     }
@@ -222,6 +395,13 @@ class AIWindowManager {
         this.bridge.disconnect();
     }
 
+    /**
+     * Receive change notifications from a shared backend daemon
+     */
+    async subscribe() {
+        return this.bridge.subscribe();
+    }
+
     /**
      * Get list of active AI applications
      */
@@ -359,7 +539,8 @@ async function demonstrateUsage() {
     console.log('AI Window Manager Demo');
     console.log('='.repeat(30));
 
-    // Create window manager instance
+    // Create window manager instance. Pass { socketPath } as the second
+    // argument to attach to a running backend-daemon.py instead.
     const windowManager = new AIWindowManager('./backend/main.py');
 
     try {